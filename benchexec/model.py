@@ -20,6 +20,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import collections
+import functools
 import logging
 import os
 import time
@@ -52,56 +53,99 @@ _ERROR_RESULTS_FOR_TERMINATION_REASON = {
     "files-size": "FILES-SIZE LIMIT",
 }
 
+_TIMEOUT_TERMINATION_REASONS = frozenset(["cputime", "cputime-soft", "walltime"])
+
+# results of the tool that are not shown in addition to a timeout or other error
+_UNSPECIFIC_TOOL_RESULTS = frozenset(
+    result.RESULT_LIST_OTHER + ["KILLED", "KILLED BY SIGNAL 9"]
+)
+
+# Use the libyaml-based loader if available, it is much faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def substitute_vars(oldList, runSet=None, task_file=None):
     """
     This method replaces special substrings from a list of string
     and return a new list.
     """
+    if not any("${" in s for s in oldList):
+        # nothing to substitute, avoid building the list of variables
+        return list(oldList)
+
     keyValueList = []
     if runSet:
         benchmark = runSet.benchmark
-
-        # list with tuples (key, value): 'key' is replaced by 'value'
-        keyValueList = [
-            ("benchmark_name", benchmark.name),
-            ("benchmark_date", benchmark.instance),
-            ("benchmark_path", benchmark.base_dir or "."),
-            ("benchmark_path_abs", os.path.abspath(benchmark.base_dir)),
-            ("benchmark_file", os.path.basename(benchmark.benchmark_file)),
-            (
-                "benchmark_file_abs",
-                os.path.abspath(os.path.basename(benchmark.benchmark_file)),
-            ),
-            ("logfile_path", os.path.dirname(runSet.log_folder) or "."),
-            ("logfile_path_abs", os.path.abspath(runSet.log_folder)),
-            ("rundefinition_name", runSet.real_name if runSet.real_name else ""),
-            ("test_name", runSet.real_name if runSet.real_name else ""),
-        ]
+        keyValueList.extend(
+            _run_set_vars(
+                benchmark.name,
+                benchmark.instance,
+                benchmark.base_dir,
+                benchmark.benchmark_file,
+                runSet.log_folder,
+                runSet.real_name,
+            )
+        )
 
     if task_file:
-        var_prefix = "taskdef_" if task_file.endswith(".yml") else "inputfile_"
-        keyValueList.append((var_prefix + "name", os.path.basename(task_file)))
-        keyValueList.append((var_prefix + "path", os.path.dirname(task_file) or "."))
-        keyValueList.append(
-            (var_prefix + "path_abs", os.path.dirname(os.path.abspath(task_file)))
-        )
+        keyValueList.extend(_task_file_vars(task_file))
 
     # do not use keys twice
     assert len({key for (key, value) in keyValueList}) == len(keyValueList)
 
-    return [util.substitute_vars(s, keyValueList) for s in oldList]
+    return [util.substitute_vars(s, keyValueList) if "${" in s else s for s in oldList]
+
+
+# The cached variables contain results of os.path.abspath(), which depend on the
+# current directory. BenchExec does not change it in its own process (only in
+# child processes of runs), and the caches are cleared in _clear_caches() for each
+# benchmark anyway, such that they also do not grow with each loaded benchmark.
+@functools.lru_cache(maxsize=None)
+def _run_set_vars(
+    benchmark_name, benchmark_instance, base_dir, benchmark_file, log_folder, real_name
+):
+    """Return the variables for substitute_vars() that are common for a run set."""
+    # tuples (key, value): 'key' is replaced by 'value'
+    return (
+        ("benchmark_name", benchmark_name),
+        ("benchmark_date", benchmark_instance),
+        ("benchmark_path", base_dir or "."),
+        ("benchmark_path_abs", os.path.abspath(base_dir)),
+        ("benchmark_file", os.path.basename(benchmark_file)),
+        ("benchmark_file_abs", os.path.abspath(os.path.basename(benchmark_file))),
+        ("logfile_path", os.path.dirname(log_folder) or "."),
+        ("logfile_path_abs", os.path.abspath(log_folder)),
+        ("rundefinition_name", real_name if real_name else ""),
+        ("test_name", real_name if real_name else ""),
+    )
+
+
+# substitute_vars() is called several times in a row for the same task,
+# so a small cache is enough.
+@functools.lru_cache(maxsize=128)
+def _task_file_vars(task_file):
+    """Return the variables for substitute_vars() that are specific for a task."""
+    var_prefix = "taskdef_" if task_file.endswith(".yml") else "inputfile_"
+    return (
+        (var_prefix + "name", os.path.basename(task_file)),
+        (var_prefix + "path", os.path.dirname(task_file) or "."),
+        (var_prefix + "path_abs", os.path.dirname(os.path.abspath(task_file))),
+    )
 
 
 def load_task_definition_file(task_def_file):
     """Open and parse a task-definition file in YAML format."""
     try:
-        with open(task_def_file) as f:
-            task_def = yaml.safe_load(f)
+        # task definitions are small, parsing a buffer avoids the read callbacks
+        with open(task_def_file, "rb") as f:
+            content = f.read()
+        task_def = yaml.load(content, Loader=_YAML_LOADER)
     except OSError as e:
         raise BenchExecException("Cannot open task-definition file: " + str(e))
     except yaml.YAMLError as e:
-        raise BenchExecException("Invalid task definition: " + str(e))
+        raise BenchExecException(
+            "Invalid task definition in file {}: {}".format(task_def_file, e)
+        )
 
     if str(task_def.get("format_version")) not in ["0.1", "1.0"]:
         raise BenchExecException(
@@ -113,6 +157,80 @@ def load_task_definition_file(task_def_file):
     return task_def
 
 
+@functools.lru_cache(maxsize=None)
+def _load_task_definition_file_cached(task_def_file):
+    """
+    Like load_task_definition_file(), but cache the result, because the same
+    file is typically used by several run definitions.
+    Callers must not modify the returned dict.
+    """
+    return load_task_definition_file(task_def_file)
+
+
+def _expand_filename_pattern_cached(pattern, base_dir):
+    """
+    Like util.expand_filename_pattern(), but cache the result,
+    which is returned as a sorted tuple.
+    """
+    # Join and normalize before looking into the cache, such that the same pattern
+    # used from different directories (e.g., "../properties/unreach-call.prp" in
+    # task definitions of sibling directories) results in a single cache entry.
+    return _glob_cached(os.path.normpath(os.path.join(base_dir, pattern)))
+
+
+@functools.lru_cache(maxsize=None)
+def _glob_cached(pattern):
+    return tuple(sorted(util.expand_filename_pattern(pattern, "")))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_file_list(filename):
+    """
+    Read a file that contains a list of file-name patterns, one per line,
+    and return the patterns as a tuple. Comments and empty lines are ignored.
+    """
+    with open(filename, "rt") as f:
+        # strip() removes 'newline' behind the line
+        lines = [line.strip() for line in f]
+    return tuple(line for line in lines if not util.is_comment(line))
+
+
+@functools.lru_cache(maxsize=None)
+def _stat_cached(path):
+    """
+    Like os.stat(), but cache the result. This is useful for property files,
+    which are compared against the property files of all task definitions.
+    """
+    return os.stat(path)
+
+
+def _create_expected_result(expected_result, subproperty):
+    """
+    Create an ExpectedResult instance. There are only few distinct ones,
+    so equal instances (which are immutable) are shared between runs.
+    """
+    try:
+        return _create_expected_result_cached(expected_result, subproperty)
+    except TypeError:
+        # values that are not hashable (e.g., a list as subproperty) are not shared
+        return result.ExpectedResult(expected_result, subproperty)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_expected_result_cached(expected_result, subproperty):
+    return result.ExpectedResult(expected_result, subproperty)
+
+
+def _clear_caches():
+    """Clear the caches that are filled while loading a benchmark definition."""
+    _load_task_definition_file_cached.cache_clear()
+    _glob_cached.cache_clear()
+    _run_set_vars.cache_clear()
+    _task_file_vars.cache_clear()
+    _read_file_list.cache_clear()
+    _stat_cached.cache_clear()
+
+
 def load_tool_info(tool_name, config):
     """
     Load the tool-info class.
@@ -128,7 +246,7 @@ def load_tool_info(tool_name, config):
 
             tool = containerized_tool.ContainerizedTool(tool_module, config)
         else:
-            tool = __import__(tool_module, fromlist=["Tool"]).Tool()
+            tool = _get_tool_class(tool_module)()
     except ImportError as ie:
         sys.exit(
             'Unsupported tool "{0}" specified. ImportError: {1}'.format(tool_name, ie)
@@ -141,6 +259,15 @@ def load_tool_info(tool_name, config):
     return tool_module, tool
 
 
+@functools.lru_cache(maxsize=None)
+def _get_tool_class(tool_module):
+    """
+    Import the given tool-info module and return its class Tool.
+    Only the class is cached, instances of it may have state.
+    """
+    return __import__(tool_module, fromlist=["Tool"]).Tool
+
+
 def cmdline_for_run(tool, executable, options, sourcefiles, propertyfile, rlimits):
     working_directory = tool.working_directory(executable)
 
@@ -158,9 +285,19 @@ def cmdline_for_run(tool, executable, options, sourcefiles, propertyfile, rlimit
         rlimits.copy(),
     )
     assert all(args), "Tool cmdline contains empty or None argument: " + str(args)
-    args = [os.path.expandvars(arg) for arg in args]
-    args = [os.path.expanduser(arg) for arg in args]
-    return args
+    return [os.path.expanduser(os.path.expandvars(arg)) for arg in args]
+
+
+def _group_children_by_tag(elem):
+    """
+    Return a dict from tag names to lists of the child elements of the given
+    XML element with this tag, such that we iterate only once over all children.
+    Missing tags are mapped to empty lists.
+    """
+    children_by_tag = collections.defaultdict(list)
+    for child in elem:
+        children_by_tag[child.tag].append(child)
+    return children_by_tag
 
 
 class Benchmark(object):
@@ -205,6 +342,8 @@ class Benchmark(object):
                 "It's root element is not named 'benchmark'.".format(benchmark_file)
             )
 
+        children_by_tag = _group_children_by_tag(rootTag)
+
         # get tool
         tool_name = rootTag.get("tool")
         if not tool_name:
@@ -250,7 +389,6 @@ class Benchmark(object):
                     )
 
         self.rlimits = {}
-        keys = list(rootTag.keys())
         handle_limit_value(
             "Time", TIMELIMIT, config.timelimit, util.parse_timespan_value
         )
@@ -278,8 +416,15 @@ class Benchmark(object):
             else:
                 self.rlimits[TIMELIMIT] = hardtimelimit
 
+        # effective limits after which a run is considered as timeout
+        self.cputime_limit = self.rlimits.get(
+            SOFTTIMELIMIT, self.rlimits.get(TIMELIMIT, float("inf"))
+        )
+        self.walltime_limit = self.rlimits.get(WALLTIMELIMIT, float("inf"))
+
         # get number of threads, default value is 1
-        self.num_of_threads = int(rootTag.get("threads")) if ("threads" in keys) else 1
+        threads = rootTag.get("threads")
+        self.num_of_threads = int(threads) if threads is not None else 1
         if config.num_of_threads is not None:
             self.num_of_threads = config.num_of_threads
         if self.num_of_threads < 1:
@@ -293,19 +438,20 @@ class Benchmark(object):
         )
 
         # get columns
-        self.columns = Benchmark.load_columns(rootTag.find("columns"))
+        columns_tags = children_by_tag["columns"]
+        self.columns = Benchmark.load_columns(columns_tags[0] if columns_tags else None)
 
         # get global source files, they are used in all run sets
-        if rootTag.findall("sourcefiles"):
+        if children_by_tag["sourcefiles"]:
             sys.exit(
                 "Benchmark file {} has unsupported old format. "
                 "Rename <sourcefiles> tags to <tasks>.".format(benchmark_file)
             )
-        globalSourcefilesTags = rootTag.findall("tasks")
+        globalSourcefilesTags = children_by_tag["tasks"]
 
         # get required files
         self._required_files = set()
-        for required_files_tag in rootTag.findall("requiredfiles"):
+        for required_files_tag in children_by_tag["requiredfiles"]:
             required_files = util.expand_filename_pattern(
                 required_files_tag.text, self.base_dir
             )
@@ -318,10 +464,10 @@ class Benchmark(object):
 
         # get requirements
         self.requirements = Requirements(
-            rootTag.findall("require"), self.rlimits, config
+            children_by_tag["require"], self.rlimits, config
         )
 
-        result_files_tags = rootTag.findall("resultfiles")
+        result_files_tags = children_by_tag["resultfiles"]
         if result_files_tags:
             self.result_files_patterns = [
                 os.path.normpath(p.text) for p in result_files_tags if p.text
@@ -337,10 +483,15 @@ class Benchmark(object):
 
         # get benchmarks
         self.run_sets = []
-        for (i, rundefinitionTag) in enumerate(rootTag.findall("rundefinition")):
-            self.run_sets.append(
-                RunSet(rundefinitionTag, self, i + 1, globalSourcefilesTags)
-            )
+        try:
+            for (i, rundefinitionTag) in enumerate(children_by_tag["rundefinition"]):
+                self.run_sets.append(
+                    RunSet(rundefinitionTag, self, i + 1, globalSourcefilesTags)
+                )
+        finally:
+            # The file system could change before the next benchmark is loaded,
+            # also if loading this one fails.
+            _clear_caches()
 
         if not self.run_sets:
             logging.warning(
@@ -425,6 +576,13 @@ class RunSet(object):
         # get name of run set, name is optional, the result can be "None"
         self.real_name = rundefinitionTag.get("name")
 
+        # the selection does not change, but should_be_executed() is called often
+        selected_run_definitions = benchmark.config.selected_run_definitions
+        self._selected = not selected_run_definitions or any(
+            util.wildcard_match(self.real_name, run_definition)
+            for run_definition in selected_run_definitions
+        )
+
         # index is the number of the run set
         self.index = index
 
@@ -438,6 +596,8 @@ class RunSet(object):
 
         # get all run-set-specific options from rundefinitionTag
         self.options = benchmark.options + util.get_list_from_xml(rundefinitionTag)
+        # equal lists of options of runs, see shared_options()
+        self._shared_options = {}
         self.propertyfile = (
             util.text_or_none(
                 util.get_single_child_from_xml(rundefinitionTag, PROPERTY_TAG)
@@ -456,11 +616,24 @@ class RunSet(object):
                 "Benchmark file {} has unsupported old format. "
                 "Rename <sourcefiles> tags to <tasks>.".format(benchmark.benchmark_file)
             )
-        self.blocks = self.extract_runs_from_xml(
-            globalSourcefilesTags + rundefinitionTag.findall("tasks"),
-            required_files_pattern,
-        )
+        sourcefilesTags = globalSourcefilesTags + rundefinitionTag.findall("tasks")
+        if self.should_be_executed():
+            self.blocks = self.extract_runs_from_xml(
+                sourcefilesTags, required_files_pattern
+            )
+        else:
+            # Loading tasks can be expensive (e.g., parsing task-definition files),
+            # so skip it if the runs would not be executed anyway,
+            # but keep the (empty) blocks because they determine the name.
+            self.blocks = [
+                SourcefileSet(sourcefilesTag.get("name"), index, [])
+                for index, sourcefilesTag in self.selected_sourcefiles_tags(
+                    sourcefilesTags
+                )
+            ]
         self.runs = [run for block in self.blocks for run in block.runs]
+        # only needed while creating the runs, do not keep the keys in memory
+        self._shared_options = None
 
         names = [self.real_name]
         if len(self.blocks) == 1:
@@ -476,24 +649,43 @@ class RunSet(object):
         # For 'cloud-mode' the logfile is overridden before reading it,
         # so the result will be wrong and every measured value will be missing.
         if self.should_be_executed():
-            sourcefilesSet = set()
-            for run in self.runs:
-                base = os.path.basename(run.identifier)
-                if base in sourcefilesSet:
+            base_names = collections.Counter(
+                os.path.basename(run.identifier) for run in self.runs
+            )
+            for base, count in base_names.items():
+                if count > 1:
                     logging.warning(
                         "Input file with name '%s' appears twice in runset. "
                         "This could cause problems with equal logfile-names.",
                         base,
                     )
-                else:
-                    sourcefilesSet.add(base)
-            del sourcefilesSet
+
+    def shared_options(self, options):
+        """
+        Return a list of options equal to the given one, reusing an equal list
+        from a previous call if possible (to reduce memory consumption of runs).
+        Lists are shared only between the runs that are created by this run set
+        itself, for others the given list is returned.
+        """
+        if self._shared_options is None:
+            return options
+        return self._shared_options.setdefault(tuple(options), options)
 
     def should_be_executed(self):
-        return not self.benchmark.config.selected_run_definitions or any(
-            util.wildcard_match(self.real_name, run_definition)
-            for run_definition in self.benchmark.config.selected_run_definitions
-        )
+        return self._selected
+
+    def selected_sourcefiles_tags(self, sourcefilesTagList):
+        """
+        Return pairs of index and tag for those of the given sourcefiles tags
+        that are selected to be executed.
+        """
+        for index, sourcefilesTag in enumerate(sourcefilesTagList):
+            matchName = sourcefilesTag.get("name") or str(index)
+            if not self.benchmark.config.selected_sourcefile_sets or any(
+                util.wildcard_match(matchName, sourcefile_set)
+                for sourcefile_set in self.benchmark.config.selected_sourcefile_sets
+            ):
+                yield index, sourcefilesTag
 
     def extract_runs_from_xml(self, sourcefilesTagList, global_required_files_pattern):
         """
@@ -504,14 +696,8 @@ class RunSet(object):
         # runs are structured as sourcefile sets, one set represents one sourcefiles tag
         blocks = []
 
-        for index, sourcefilesTag in enumerate(sourcefilesTagList):
+        for index, sourcefilesTag in self.selected_sourcefiles_tags(sourcefilesTagList):
             sourcefileSetName = sourcefilesTag.get("name")
-            matchName = sourcefileSetName or str(index)
-            if self.benchmark.config.selected_sourcefile_sets and not any(
-                util.wildcard_match(matchName, sourcefile_set)
-                for sourcefile_set in self.benchmark.config.selected_sourcefile_sets
-            ):
-                continue
 
             required_files_pattern = global_required_files_pattern.union(
                 {tag.text for tag in sourcefilesTag.findall("requiredfiles")}
@@ -586,12 +772,14 @@ class RunSet(object):
         """
         sourcefiles = []
 
+        children_by_tag = _group_children_by_tag(sourcefilesTag)
+
         # get included sourcefiles
-        for includedFiles in sourcefilesTag.findall("include"):
+        for includedFiles in children_by_tag["include"]:
             sourcefiles += self.expand_filename_pattern(includedFiles.text, base_dir)
 
         # get sourcefiles from list in file
-        for includesFilesFile in sourcefilesTag.findall("includesfile"):
+        for includesFilesFile in children_by_tag["includesfile"]:
 
             for file in self.expand_filename_pattern(includesFilesFile.text, base_dir):
 
@@ -605,47 +793,32 @@ class RunSet(object):
                     )
                     sys.exit()
 
-                # read files from list
-                fileWithList = open(file, "rt")
-                for line in fileWithList:
-
-                    # strip() removes 'newline' behind the line
-                    line = line.strip()
-
-                    # ignore comments and empty lines
-                    if not util.is_comment(line):
-                        sourcefiles += self.expand_filename_pattern(
-                            line, os.path.dirname(file)
+                # read files from list, lists often contain the same pattern twice
+                expanded_patterns = {}
+                for pattern in _read_file_list(file):
+                    if pattern not in expanded_patterns:
+                        expanded_patterns[pattern] = self.expand_filename_pattern(
+                            pattern, os.path.dirname(file)
                         )
-
-                fileWithList.close()
+                    sourcefiles += expanded_patterns[pattern]
 
         # remove excluded sourcefiles
-        for excludedFiles in sourcefilesTag.findall("exclude"):
-            excludedFilesList = self.expand_filename_pattern(
-                excludedFiles.text, base_dir
+        excluded_files = set()
+        for excludedFiles in children_by_tag["exclude"]:
+            excluded_files.update(
+                self.expand_filename_pattern(excludedFiles.text, base_dir)
             )
-            for excludedFile in excludedFilesList:
-                sourcefiles = util.remove_all(sourcefiles, excludedFile)
 
-        for excludesFilesFile in sourcefilesTag.findall("excludesfile"):
+        for excludesFilesFile in children_by_tag["excludesfile"]:
             for file in self.expand_filename_pattern(excludesFilesFile.text, base_dir):
                 # read files from list
-                fileWithList = open(file, "rt")
-                for line in fileWithList:
-
-                    # strip() removes 'newline' behind the line
-                    line = line.strip()
-
-                    # ignore comments and empty lines
-                    if not util.is_comment(line):
-                        excludedFilesList = self.expand_filename_pattern(
-                            line, os.path.dirname(file)
-                        )
-                        for excludedFile in excludedFilesList:
-                            sourcefiles = util.remove_all(sourcefiles, excludedFile)
+                for pattern in _read_file_list(file):
+                    excluded_files.update(
+                        self.expand_filename_pattern(pattern, os.path.dirname(file))
+                    )
 
-                fileWithList.close()
+        if excluded_files:
+            sourcefiles = [f for f in sourcefiles if f not in excluded_files]
 
         return sourcefiles
 
@@ -692,18 +865,16 @@ class RunSet(object):
         self, task_def_file, options, propertyfile, required_files_pattern
     ):
         """Create a Run from a task definition in yaml format"""
-        task_def = load_task_definition_file(task_def_file)
+        task_def = _load_task_definition_file_cached(task_def_file)
 
         def expand_patterns_from_tag(tag):
             result = []
             patterns = task_def.get(tag, [])
-            if isinstance(patterns, str) or not isinstance(
-                patterns, collections.Iterable
-            ):
+            if not isinstance(patterns, (list, tuple)):
                 # accept single string in addition to list of strings
                 patterns = [patterns]
             for pattern in patterns:
-                expanded = util.expand_filename_pattern(
+                expanded = _expand_filename_pattern_cached(
                     str(pattern), os.path.dirname(task_def_file)
                 )
                 if not expanded:
@@ -712,7 +883,6 @@ class RunSet(object):
                             pattern, task_def_file
                         )
                     )
-                expanded.sort()
                 result.extend(expanded)
             return result
 
@@ -751,7 +921,7 @@ class RunSet(object):
                         task_def_file
                     )
                 )
-            expanded = util.expand_filename_pattern(
+            expanded = _expand_filename_pattern_cached(
                 prop_dict["property_file"], os.path.dirname(task_def_file)
             )
             if len(expanded) != 1:
@@ -761,10 +931,8 @@ class RunSet(object):
                     )
                 )
 
-            # TODO We could reduce I/O by checking absolute paths and using os.path.samestat
-            # with cached stat calls.
-            if prop.filename == expanded[0] or os.path.samefile(
-                prop.filename, expanded[0]
+            if prop.filename == expanded[0] or os.path.samestat(
+                _stat_cached(prop.filename), _stat_cached(expanded[0])
             ):
                 expected_result = prop_dict.get("expected_verdict")
                 if expected_result is not None and not isinstance(
@@ -775,7 +943,7 @@ class RunSet(object):
                             expected_result, prop_dict["property_file"], task_def_file
                         )
                     )
-                run.expected_results[prop.filename] = result.ExpectedResult(
+                run.expected_results[prop.filename] = _create_expected_result(
                     expected_result, prop_dict.get("subproperty")
                 )
 
@@ -813,10 +981,9 @@ class RunSet(object):
                 "Expanded variables in expression %r to %r.", pattern, expandedPattern
             )
 
-        fileList = util.expand_filename_pattern(expandedPattern, base_dir)
-
-        # sort alphabetical,
-        fileList.sort()
+        # cached because, e.g., required-files patterns are expanded for every run
+        # and often do not depend on the task (result is sorted alphabetically)
+        fileList = list(_expand_filename_pattern_cached(expandedPattern, base_dir))
 
         if not fileList:
             logging.warning("No files found matching %r.", pattern)
@@ -829,6 +996,8 @@ class SourcefileSet(object):
     A SourcefileSet contains a list of runs and a name.
     """
 
+    __slots__ = ("real_name", "name", "runs")
+
     def __init__(self, name, index, runs):
         self.real_name = name  # this name is optional
         self.name = name or str(index)  # this name is always non-empty
@@ -838,11 +1007,39 @@ class SourcefileSet(object):
 _logged_missing_property_files = set()
 
 
+def _log_property_file_once(propertyfile, msg):
+    """Log a warning about the given property file unless one was already logged."""
+    if propertyfile not in _logged_missing_property_files:
+        _logged_missing_property_files.add(propertyfile)
+        logging.warning(msg)
+
+
 class Run(object):
     """
     A Run contains some sourcefile, some options, propertyfiles and some other stuff, that is needed for the Run.
     """
 
+    # There can be many runs, so avoid the memory overhead of __dict__.
+    __slots__ = (
+        "identifier",
+        "sourcefiles",
+        "runSet",
+        "specific_options",
+        "_base_name",
+        "expected_results",
+        "required_files",
+        "options",
+        "propertyfile",
+        "properties",
+        "columns",
+        "values",
+        "status",
+        "category",
+        # set by OutputHandler
+        "resultline",
+        "xml",
+    )
+
     def __init__(
         self,
         identifier,
@@ -860,50 +1057,48 @@ class Run(object):
         self.sourcefiles = sourcefiles
         self.runSet = runSet
         self.specific_options = fileOptions  # options that are specific for this run
-        self.log_file = runSet.log_folder + os.path.basename(self.identifier) + ".log"
-        self.result_files_folder = os.path.join(
-            runSet.result_files_folder, os.path.basename(self.identifier)
-        )
+        # used for the paths of log file and result files
+        self._base_name = os.path.basename(identifier)
         self.expected_results = expected_results or {}  # filled externally
 
-        self.required_files = set(required_files)
-        rel_sourcefile = os.path.relpath(self.identifier, runSet.benchmark.base_dir)
-        for pattern in required_files_patterns:
-            this_required_files = runSet.expand_filename_pattern(
-                pattern, runSet.benchmark.base_dir, rel_sourcefile
-            )
-            if not this_required_files:
-                logging.warning(
-                    "Pattern %s in requiredfiles tag did not match any file for task %s.",
-                    pattern,
-                    self.identifier,
+        # collected as list, duplicates are removed at the end
+        required_files = list(required_files)
+        if required_files_patterns:
+            rel_sourcefile = os.path.relpath(self.identifier, runSet.benchmark.base_dir)
+            for pattern in required_files_patterns:
+                this_required_files = runSet.expand_filename_pattern(
+                    pattern, runSet.benchmark.base_dir, rel_sourcefile
                 )
-            self.required_files.update(this_required_files)
+                if not this_required_files:
+                    logging.warning(
+                        "Pattern %s in requiredfiles tag did not match any file for task %s.",
+                        pattern,
+                        self.identifier,
+                    )
+                required_files.extend(this_required_files)
 
         # combine all options to be used when executing this run
         # (reduce memory-consumption: if 2 lists are equal, do not use the second one)
         self.options = runSet.options + fileOptions if fileOptions else runSet.options
         substitutedOptions = substitute_vars(self.options, runSet, self.identifier)
-        if substitutedOptions != self.options:
-            self.options = substitutedOptions  # for less memory again
+        if substitutedOptions == runSet.options:
+            self.options = runSet.options
+        else:
+            self.options = runSet.shared_options(substitutedOptions)
 
         self.propertyfile = propertyfile or runSet.propertyfile
         self.properties = []  # filled externally
 
-        def log_property_file_once(msg):
-            if not self.propertyfile in _logged_missing_property_files:
-                _logged_missing_property_files.add(self.propertyfile)
-                logging.warning(msg)
-
         # replace run-specific stuff in the propertyfile and add it to the set of required files
         if self.propertyfile is None:
-            log_property_file_once(
-                "No propertyfile specified. Score computation will ignore the results."
+            _log_property_file_once(
+                self.propertyfile,
+                "No propertyfile specified. Score computation will ignore the results.",
             )
         else:
             # we check two cases: direct filename or user-defined substitution, one of them must be a 'file'
             # TODO: do we need the second case? it is equal to previous used option "-spec ${inputfile_path}/ALL.prp"
-            expandedPropertyFiles = util.expand_filename_pattern(
+            expandedPropertyFiles = _expand_filename_pattern_cached(
                 self.propertyfile, self.runSet.benchmark.base_dir
             )
             substitutedPropertyfiles = substitute_vars(
@@ -913,10 +1108,11 @@ class Run(object):
 
             if expandedPropertyFiles:
                 if len(expandedPropertyFiles) > 1:
-                    log_property_file_once(
+                    _log_property_file_once(
+                        self.propertyfile,
                         "Pattern {0} for input file {1} in propertyfile tag matches more than one file. Only {2} will be used.".format(
                             self.propertyfile, self.identifier, expandedPropertyFiles[0]
-                        )
+                        ),
                     )
                 self.propertyfile = expandedPropertyFiles[0]
             elif substitutedPropertyfiles and os.path.isfile(
@@ -924,24 +1120,23 @@ class Run(object):
             ):
                 self.propertyfile = substitutedPropertyfiles[0]
             else:
-                log_property_file_once(
+                _log_property_file_once(
+                    self.propertyfile,
                     "Pattern {0} for input file {1} in propertyfile tag did not match any file. It will be ignored.".format(
                         self.propertyfile, self.identifier
-                    )
+                    ),
                 )
                 self.propertyfile = None
 
         if self.propertyfile:
-            self.required_files.add(self.propertyfile)
+            required_files.append(self.propertyfile)
 
-        self.required_files = list(self.required_files)
+        # remove duplicates but keep a deterministic order
+        self.required_files = list(collections.OrderedDict.fromkeys(required_files))
 
-        # Copy columns for having own objects in run
-        # (we need this for storing the results in them).
-        self.columns = [
-            Column(c.text, c.title, c.number_of_digits)
-            for c in self.runSet.benchmark.columns
-        ]
+        # Share the (empty) columns of the benchmark until set_result() creates
+        # own copies for storing the results in them (reduces memory consumption).
+        self.columns = self.runSet.benchmark.columns
 
         # here we store the optional result values, e.g. memory usage, energy, host name
         # keys need to be strings, if first character is "@" the value is marked as hidden (e.g., debug info)
@@ -951,6 +1146,17 @@ class Run(object):
         self.status = ""
         self.category = result.CATEGORY_UNKNOWN
 
+    # The following paths are computed on demand instead of being stored,
+    # because storing them for each of possibly many runs costs a lot of memory.
+
+    @property
+    def log_file(self):
+        return self.runSet.log_folder + self._base_name + ".log"
+
+    @property
+    def result_files_folder(self):
+        return os.path.join(self.runSet.result_files_folder, self._base_name)
+
     def cmdline(self):
         assert (
             self.runSet.benchmark.executable is not None
@@ -998,16 +1204,16 @@ class Run(object):
         # if time is too high. Since removal of ulimit time limit this should not be
         # necessary, but also does not harm. We might reconsider this in the future.
         isTimeout = (
-            termination_reason in ["cputime", "cputime-soft", "walltime"]
-            or self._is_timeout()
+            termination_reason in _TIMEOUT_TERMINATION_REASONS or self._is_timeout()
         )
 
         # read output
         try:
             with open(self.log_file, "rt", errors="ignore") as outputFile:
-                output = outputFile.readlines()
                 # first 6 lines are for logging, rest is output of subprocess, see runexecutor.py for details
-                output = output[6:]
+                for _ in range(6):
+                    outputFile.readline()
+                output = outputFile.readlines()
         except IOError as e:
             logging.warning("Cannot read log file: %s", e.strerror)
             output = []
@@ -1019,13 +1225,23 @@ class Run(object):
             self.expected_results, self.status, self.properties
         )
 
-        for column in self.columns:
-            substitutedColumnText = substitute_vars(
-                [column.text], self.runSet, self.sourcefiles[0]
-            )[0]
-            column.value = self.runSet.benchmark.tool.get_value_from_output(
-                output, substitutedColumnText
+        if self.columns:
+            self.columns = [
+                Column(c.text, c.title, c.number_of_digits)
+                for c in self.runSet.benchmark.columns
+            ]
+
+            # substitute variables of all columns at once
+            substitutedColumnTexts = substitute_vars(
+                [column.text for column in self.columns],
+                self.runSet,
+                self.sourcefiles[0],
             )
+            tool = self.runSet.benchmark.tool
+            for column, substitutedColumnText in zip(
+                self.columns, substitutedColumnTexts
+            ):
+                column.value = tool.get_value_from_output(output, substitutedColumnText)
 
     def _analyze_result(self, exitcode, output, isTimeout, termination_reason):
         """Return status according to result and output of tool."""
@@ -1069,8 +1285,10 @@ class Run(object):
         if not status:
             # regular termination
             status = tool_status
-        elif tool_status and tool_status not in (
-            result.RESULT_LIST_OTHER + [status, "KILLED", "KILLED BY SIGNAL 9"]
+        elif (
+            tool_status
+            and tool_status != status
+            and tool_status not in _UNSPECIFIC_TOOL_RESULTS
         ):
             # timeout/OOM but tool still returned some result
             status = "{} ({})".format(status, tool_status)
@@ -1079,28 +1297,11 @@ class Run(object):
 
     def _is_timeout(self):
         """ try to find out whether the tool terminated because of a timeout """
-        if self.values.get("cputime") is None:
-            is_cpulimit = False
-        else:
-            rlimits = self.runSet.benchmark.rlimits
-            if SOFTTIMELIMIT in rlimits:
-                limit = rlimits[SOFTTIMELIMIT]
-            elif TIMELIMIT in rlimits:
-                limit = rlimits[TIMELIMIT]
-            else:
-                limit = float("inf")
-            is_cpulimit = self.values["cputime"] > limit
-
-        if self.values.get("walltime") is None:
-            is_walllimit = False
-        else:
-            rlimits = self.runSet.benchmark.rlimits
-            if WALLTIMELIMIT in rlimits:
-                limit = rlimits[WALLTIMELIMIT]
-            else:
-                limit = float("inf")
-            is_walllimit = self.values["walltime"] > limit
-
+        benchmark = self.runSet.benchmark
+        cputime = self.values.get("cputime")
+        is_cpulimit = cputime is not None and cputime > benchmark.cputime_limit
+        walltime = self.values.get("walltime")
+        is_walllimit = walltime is not None and walltime > benchmark.walltime_limit
         return is_cpulimit or is_walllimit
 
 
@@ -1109,6 +1310,8 @@ class Column(object):
     The class Column contains text, title and number_of_digits of a column.
     """
 
+    __slots__ = ("text", "title", "number_of_digits", "value")
+
     def __init__(self, text, title, numOfDigits):
         self.text = text
         self.title = title
@@ -1124,6 +1327,8 @@ class Requirements(object):
     If the user gives a cpu_model in the config, it overrides the previous cpu_model.
     """
 
+    __slots__ = ("cpu_model", "memory", "cpu_cores")
+
     def __init__(self, tags, rlimits, config):
 
         self.cpu_model = None
@@ -21,12 +21,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import logging
 import sys
+import tempfile
+import time
+import types
 import unittest
 
 sys.dont_write_bytecode = True  # prevent creation of .pyc files
 
 from benchexec.util import ProcessExitCode
-from benchexec.model import Run
+from benchexec.model import Benchmark, Run
 from benchexec.result import *  # @UnusedWildImport
 from benchexec.tools.template import BaseTool
 
@@ -54,6 +57,8 @@ class TestResult(unittest.TestCase):
         runSet.benchmark.name = "Test"
         runSet.benchmark.instance = "Test"
         runSet.benchmark.rlimits = {}
+        runSet.benchmark.cputime_limit = float("inf")
+        runSet.benchmark.walltime_limit = float("inf")
         runSet.benchmark.tool = BaseTool()
 
         def determine_result(self, returncode, returnsignal, output, isTimeout=False):
@@ -65,6 +70,65 @@ class TestResult(unittest.TestCase):
             identifier="test.c", sourcefiles=["test.c"], fileOptions=[], runSet=runSet
         )
 
+    def create_run_with_limits(self, limits):
+        """Create a run of a real benchmark with the given limits (XML attributes)"""
+        config = types.SimpleNamespace(
+            container=False,
+            name=None,
+            output_path="",
+            timelimit=None,
+            walltimelimit=None,
+            memorylimit=None,
+            corelimit=None,
+            num_of_threads=None,
+            selected_run_definitions=None,
+            selected_sourcefile_sets=None,
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".xml") as benchmark_file:
+            benchmark_file.write(
+                '<benchmark tool="dummy" {}><rundefinition/></benchmark>'.format(
+                    " ".join('{}="{}"'.format(k, v) for k, v in limits.items())
+                )
+            )
+            benchmark_file.flush()
+            benchmark = Benchmark(benchmark_file.name, config, time.gmtime(0))
+        return Run(
+            identifier="test.c",
+            sourcefiles=["test.c"],
+            fileOptions=[],
+            runSet=benchmark.run_sets[0],
+        )
+
+    def assertTimeout(self, run, expected, cputime=None, walltime=None):
+        run.values = {}
+        if cputime is not None:
+            run.values["cputime"] = cputime
+        if walltime is not None:
+            run.values["walltime"] = walltime
+        self.assertEqual(expected, run._is_timeout())
+
+    def test_is_timeout(self):
+        run = self.create_run_with_limits({})
+        self.assertTimeout(run, False, cputime=1000, walltime=1000)
+        self.assertTimeout(run, False)
+
+        run = self.create_run_with_limits({"timelimit": "10s"})
+        self.assertTimeout(run, False, cputime=10, walltime=1000)
+        self.assertTimeout(run, True, cputime=11)
+
+        # soft time limit is relevant if hard time limit is larger
+        run = self.create_run_with_limits({"timelimit": "10s", "hardtimelimit": "20s"})
+        self.assertTimeout(run, False, cputime=10)
+        self.assertTimeout(run, True, cputime=11)
+
+        run = self.create_run_with_limits({"hardtimelimit": "20s"})
+        self.assertTimeout(run, False, cputime=20)
+        self.assertTimeout(run, True, cputime=21)
+
+        run = self.create_run_with_limits({"walltimelimit": "30s"})
+        self.assertTimeout(run, False, cputime=1000, walltime=30)
+        self.assertTimeout(run, True, walltime=31)
+
     def test_simple(self):
         run = self.create_run(info_result=RESULT_UNKNOWN)
         self.assertEqual(
@@ -0,0 +1,189 @@
+# BenchExec is a framework for reliable benchmarking.
+# This file is part of BenchExec.
+#
+# Copyright (C) 2007-2015  Dirk Beyer
+# All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# prepare for Python 3
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import logging
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+sys.dont_write_bytecode = True  # prevent creation of .pyc files
+
+from benchexec import result
+from benchexec import util
+from benchexec.model import Benchmark
+
+BENCHMARK_DEFINITION = """<benchmark tool="dummy">
+  <rundefinition name="include">
+    <tasks name="all">
+      <include>tasks/*.c</include>
+      <exclude>tasks/b.c</exclude>
+      <exclude>tasks/d.c</exclude>
+    </tasks>
+  </rundefinition>
+  <rundefinition name="list-with-excludes">
+    <tasks name="list">
+      <includesfile>lists/tasks.set</includesfile>
+      <excludesfile>lists/excluded.set</excludesfile>
+    </tasks>
+  </rundefinition>
+  <rundefinition name="list">
+    <tasks>
+      <includesfile>lists/tasks.set</includesfile>
+    </tasks>
+  </rundefinition>
+</benchmark>
+"""
+
+TASKS_SET = """# comment
+../tasks/c.c
+
+// another comment
+../tasks/a.c
+../tasks/c.c
+../tasks/e.c
+"""
+
+EXCLUDED_SET = """# comment
+../tasks/e.c
+"""
+
+TASK_DEFINITION = """format_version: '1.0'
+input_files: 'a.c'
+properties:
+  - property_file: valid-memsafety.prp
+    expected_verdict: false
+    subproperty: {}
+"""
+
+
+class TestBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.longMessage = True
+        cls.maxDiff = None
+        logging.disable(logging.CRITICAL)
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp(prefix="BenchExec_test_model_")
+        os.mkdir(os.path.join(self.base_dir, "tasks"))
+        for name in ["a.c", "b.c", "c.c", "d.c", "e.c"]:
+            util.write_file("", self.base_dir, "tasks", name)
+        os.mkdir(os.path.join(self.base_dir, "lists"))
+        util.write_file(TASKS_SET, self.base_dir, "lists", "tasks.set")
+        util.write_file(EXCLUDED_SET, self.base_dir, "lists", "excluded.set")
+        util.write_file(BENCHMARK_DEFINITION, self.base_dir, "benchmark.xml")
+
+    def tearDown(self):
+        util.rmtree(self.base_dir)
+
+    def load_benchmark(self, selected_run_definitions=None):
+        config = types.SimpleNamespace(
+            container=False,
+            name=None,
+            output_path="",
+            timelimit=None,
+            walltimelimit=None,
+            memorylimit=None,
+            corelimit=None,
+            num_of_threads=None,
+            selected_run_definitions=selected_run_definitions,
+            selected_sourcefile_sets=None,
+        )
+        return Benchmark(
+            os.path.join(self.base_dir, "benchmark.xml"), config, time.gmtime(0)
+        )
+
+    def assertRunIdentifiers(self, run_set, expected):
+        self.assertEqual(
+            [os.path.relpath(run.identifier, self.base_dir) for run in run_set.runs],
+            expected,
+            run_set.real_name,
+        )
+
+    def test_task_selection(self):
+        run_sets = self.load_benchmark().run_sets
+        self.assertRunIdentifiers(run_sets[0], ["tasks/a.c", "tasks/c.c", "tasks/e.c"])
+        # order and duplicates of the list file are kept
+        self.assertRunIdentifiers(run_sets[1], ["tasks/c.c", "tasks/a.c", "tasks/c.c"])
+        self.assertRunIdentifiers(
+            run_sets[2], ["tasks/c.c", "tasks/a.c", "tasks/c.c", "tasks/e.c"]
+        )
+
+    def test_task_selection_after_change_of_list(self):
+        self.load_benchmark()
+        util.write_file("../tasks/b.c\n", self.base_dir, "lists", "tasks.set")
+        self.assertRunIdentifiers(self.load_benchmark().run_sets[2], ["tasks/b.c"])
+
+    def test_name_of_unselected_run_set(self):
+        run_sets = self.load_benchmark(selected_run_definitions=["list"]).run_sets
+        self.assertEqual(
+            [run_set.name for run_set in run_sets],
+            ["include.all", "list-with-excludes.list", "list"],
+        )
+        self.assertEqual([len(run_set.runs) for run_set in run_sets], [0, 0, 4])
+
+    def test_shared_options_after_loading(self):
+        run_set = self.load_benchmark().run_sets[0]
+        options = ["-a"]
+        self.assertIs(run_set.shared_options(options), options)
+
+    def test_expected_results_of_task_definitions(self):
+        util.write_file(
+            "CHECK( init(main()), LTL(G valid-free) )\n",
+            self.base_dir,
+            "tasks",
+            "valid-memsafety.prp",
+        )
+        for name, subproperty in [
+            ("free1", "valid-free"),
+            ("free2", "valid-free"),
+            ("list", "[valid-free]"),
+        ]:
+            util.write_file(
+                TASK_DEFINITION.format(subproperty),
+                self.base_dir,
+                "tasks",
+                name + ".yml",
+            )
+        util.write_file(
+            """<benchmark tool="dummy">
+              <rundefinition>
+                <propertyfile>tasks/valid-memsafety.prp</propertyfile>
+                <tasks><include>tasks/*.yml</include></tasks>
+              </rundefinition>
+            </benchmark>""",
+            self.base_dir,
+            "benchmark.xml",
+        )
+        runs = self.load_benchmark().run_sets[0].runs
+        self.assertEqual(len(runs), 3)
+        expected_results = [list(run.expected_results.values()) for run in runs]
+        for expected_result, subproperty in zip(
+            expected_results, ["valid-free", "valid-free", ["valid-free"]]
+        ):
+            self.assertEqual(
+                expected_result, [result.ExpectedResult(False, subproperty)]
+            )
+        # equal instances are shared
+        self.assertIs(expected_results[0][0], expected_results[1][0])
@@ -73,6 +73,14 @@ class TestParse(unittest.TestCase):
         self.assertEqual(util.parse_timespan_value("1h"), 60 * 60)
         self.assertEqual(util.parse_timespan_value("1d"), 24 * 60 * 60)
 
+    def test_is_comment(self):
+        self.assertTrue(util.is_comment(""))
+        self.assertTrue(util.is_comment("# comment"))
+        self.assertTrue(util.is_comment("// comment"))
+        self.assertFalse(util.is_comment("file.c"))
+        self.assertFalse(util.is_comment("/file.c"))
+        self.assertFalse(util.is_comment(" # file.c"))
+
 
 class TestProcessExitCode(unittest.TestCase):
     @classmethod
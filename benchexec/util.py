@@ -94,7 +94,7 @@ def is_code(filename):
 
 
 def is_comment(line):
-    return not line or line.startswith("#") or line.startswith("//")
+    return not line or line.startswith(("#", "//"))
 
 
 def remove_all(list_, elemToRemove):